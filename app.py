@@ -1,54 +1,119 @@
 """Flask tabanlı Türkçe kişisel bütçe ve finans takip uygulaması."""
 from __future__ import annotations
 
-from collections import defaultdict
+import heapq
+import math
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, namedtuple
 from decimal import Decimal, InvalidOperation, ROUND_DOWN
 from datetime import date, datetime, timedelta
-from functools import wraps
-from typing import Dict, List
+from functools import lru_cache, wraps
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Set
 
+import click
 from dateutil.relativedelta import relativedelta
 from flask import (
     Flask,
     current_app,
     flash,
     g,
+    jsonify,
     redirect,
     render_template,
     request,
     session,
     url_for,
 )
+from jinja2 import FileSystemBytecodeCache
 
-from models import Account, Category, SavingsGoal, Transaction, User, db
-from sqlalchemy import inspect, text
+from models import Account, Category, MonthlyCategoryTotal, SavingsGoal, Transaction, User, db
+from sqlalchemy import bindparam, event, insert, select, text
+from sqlalchemy.schema import CreateIndex
 from werkzeug.security import check_password_hash, generate_password_hash
 
 
+SCHEMA_VERSION = 5
+# Aynı süreçte aynı veritabanını açan uygulamaların kurulumu aynı anda yapmasını engeller.
+_SCHEMA_LOCK = threading.Lock()
+REPORT_CACHE_TTL = 300  # saniye
+TRANSACTIONS_PAGE_SIZE = 50
 DEFAULT_CURRENCY = "TRY"
-CURRENCY_SYMBOLS = {
-    "TRY": "₺",
-    "USD": "$",
-    "EUR": "€",
-}
-CURRENCY_CHOICES = [
+# Her istekte şablonlara verilen sabitler salt okunur tutulur.
+CURRENCY_SYMBOLS = MappingProxyType(
+    {
+        "TRY": "₺",
+        "USD": "$",
+        "EUR": "€",
+    }
+)
+CURRENCY_CHOICES = (
     ("TRY", "Türk Lirası (₺)"),
     ("USD", "ABD Doları ($)"),
     ("EUR", "Euro (€)"),
-]
+)
 
-EMOTION_CHOICES = [
+EMOTION_CHOICES = (
     ("mutluluk", "Mutluluk"),
     ("heyecan", "Heyecan"),
     ("rahatlama", "Rahatlama"),
     ("nötr", "Nötr"),
     ("pişmanlık", "Pişmanlık"),
     ("stres", "Stres"),
-]
+)
+
+EMOTION_LABELS = MappingProxyType(dict(EMOTION_CHOICES))
+
+_format_turkish_date = "{:%d.%m.%Y}".format
+_QUANTIZERS = {basamak: Decimal(f"1e-{basamak}") for basamak in range(17)}
 
-EMOTION_LABELS = dict(EMOTION_CHOICES)
+# Sık çalışan sabit biçimli sorgular bir kez kurulur; istekler yalnızca parametre bağlar.
+_STMT_TOTALS_BY_TYPE = select(Transaction.type, db.func.sum(Transaction.amount)).group_by(
+    Transaction.type
+)
+_STMT_DAILY_NET = (
+    select(Transaction.date, db.func.sum(Transaction.signed_amount))
+    .where(Transaction.date >= bindparam("baslangic"))
+    .group_by(Transaction.date)
+)
+_STMT_CATEGORY_TYPE_TOTALS = (
+    select(
+        Category.name,
+        Category.color,
+        db.func.sum(db.case((Transaction.type == "gelir", Transaction.amount), else_=0.0)),
+        db.func.sum(db.case((Transaction.type == "gider", Transaction.amount), else_=0.0)),
+    )
+    .join(Transaction, Transaction.category_id == Category.id)
+    .group_by(Category.id)
+    .order_by(Category.name)
+)
+_STMT_MONTHLY_TYPE_TOTALS = (
+    select(
+        MonthlyCategoryTotal.year_month,
+        MonthlyCategoryTotal.type,
+        db.func.sum(MonthlyCategoryTotal.total),
+    )
+    .where(MonthlyCategoryTotal.year_month >= bindparam("baslangic"))
+    .where(MonthlyCategoryTotal.year_month <= bindparam("bitis"))
+    .group_by(MonthlyCategoryTotal.year_month, MonthlyCategoryTotal.type)
+)
+_STMT_DAILY_TYPE_TOTALS = (
+    select(
+        Transaction.date,
+        db.func.sum(db.case((Transaction.type == "gelir", Transaction.amount), else_=0.0)),
+        db.func.sum(db.case((Transaction.type == "gider", Transaction.amount), else_=0.0)),
+    )
+    .where(Transaction.date >= bindparam("baslangic"))
+    .where(Transaction.date <= bindparam("bitis"))
+    .group_by(Transaction.date)
+    .order_by(Transaction.date)
+)
 
-GOAL_MILESTONES = [
+GOAL_MILESTONES = (
     {
         "threshold": 25,
         "title": "İlk Çeyrek Tamam",
@@ -73,30 +138,139 @@ GOAL_MILESTONES = [
         "message": "Tebrikler! Hedefini gerçekleştirdin. Yeni bir hedef belirlemeyi ve başarılarını not etmeyi unutma.",
         "variant": "primary",
     },
-]
+)
+_MILESTONE_THRESHOLDS = tuple(milestone["threshold"] for milestone in GOAL_MILESTONES)
+
+
+# Rapor önbelleğini eskiten modeller; bunlara yazan her commit yazma neslini bir artırır. Nesil
+# süreç içinde tutulur: önbellek tek süreçli dağıtımı varsayar, başka bir süreçteki yazmalar ancak
+# REPORT_CACHE_TTL dolunca görülür.
+_REPORT_MODELS = (Account, Category, Transaction, SavingsGoal)
+_write_generation = 0
+
+
+@event.listens_for(db.session, "after_flush")
+def _rapor_yazmalarini_isaretle(session, flush_context) -> None:
+    """Flush rapor modellerinden birine dokunduysa oturumu işaretler."""
+
+    degisenler = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(nesne, _REPORT_MODELS) for nesne in degisenler):
+        session.info["rapor_degisti"] = True
+
+
+@event.listens_for(db.session, "do_orm_execute")
+def _toplu_yazmalari_isaretle(orm_execute_state) -> None:
+    """Oturumdan çalıştırılan toplu insert/update/delete ifadelerinde oturumu işaretler.
+
+    ``session.execute(insert(...))`` ya da ``delete(MonthlyCategoryTotal)`` gibi ifadeler flush'tan
+    geçmediği için ``after_flush`` bunları görmez. İşlem olay dinleyicilerinin aylık toplamlar için
+    çalıştırdığı bağlantı ifadeleri ise zaten işaretlenmiş bir flush içinde yer alır.
+    """
+
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["rapor_degisti"] = True
+
 
+@event.listens_for(db.session, "after_commit")
+def _yazma_neslini_artir(session) -> None:
+    """İşaretli oturum commit edildiğinde yazma neslini artırır."""
 
-def create_app() -> Flask:
-    """Flask uygulamasını oluşturur ve yapılandırır."""
+    global _write_generation
+    if session.info.pop("rapor_degisti", False):
+        _write_generation += 1
+
+
+@event.listens_for(db.session, "after_rollback")
+def _rapor_isaretini_sil(session) -> None:
+    """Geri alınan oturumun rapor işaretini siler."""
+
+    session.info.pop("rapor_degisti", None)
+
+
+# Tasarruf planı satırları; şablonlar alanlara öznitelik olarak erişir.
+PlanRow = namedtuple(
+    "PlanRow",
+    [
+        "id",
+        "name",
+        "target_amount",
+        "start_date",
+        "target_date",
+        "net_savings",
+        "remaining_amount",
+        "remaining_days",
+        "progress",
+        "recommended_monthly",
+        "actual_monthly",
+        "is_completed",
+        "unlocked_milestones",
+        "total_months",
+        "elapsed_months",
+    ],
+)
+
+
+@lru_cache(maxsize=4096)
+def _ay_sayisi(baslangic: date, bitis: date) -> int:
+    """İki tarih arasındaki ay sayısını (en az 1) hesaplar."""
+
+    if bitis < baslangic:
+        return 0
+    delta = relativedelta(bitis, baslangic)
+    ay_farki = delta.years * 12 + delta.months
+    if delta.days >= 0:
+        ay_farki += 1
+    return max(ay_farki, 1)
+
+
+def create_app(config: Dict[str, object] | None = None) -> Flask:
+    """Flask uygulamasını oluşturur ve yapılandırır.
+
+    ``config`` verilirse varsayılan ayarların üzerine yazılır (ör. testlerde ayrı veritabanı).
+    """
 
     app = Flask(__name__)
     app.config["SECRET_KEY"] = "butce-uygulamasi"  # Demo amaçlı basit bir anahtar
     app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///butce.db"
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    # Derlenmiş SQL ifadeleri önbelleği; bağlantılar zaten QueuePool ile yeniden kullanılır.
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"query_cache_size": 1200}
+    app.config.update(config or {})
+
+    # Derlenmiş şablonlar instance klasöründe saklanır; yeniden başlatmalarda tekrar derlenmez.
+    jinja_cache_dir = os.path.join(app.instance_path, "jinja_cache")
+    os.makedirs(jinja_cache_dir, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(jinja_cache_dir)
 
     db.init_app(app)
-    app.config.setdefault("_schema_initialized", False)
 
-    def initialize_database(force: bool = False) -> None:
-        """Uygulamanın ihtiyaç duyduğu tabloları ve kolonları güvenli şekilde oluşturur."""
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Her yeni SQLite bağlantısında WAL ve hafif fsync ayarlarını açar."""
 
-        if app.config.get("_schema_initialized") and not force:
-            return
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
 
-        db.create_all()
+    with app.app_context():
+        event.listen(db.engine, "connect", _set_sqlite_pragmas)
 
-        inspector = inspect(db.engine)
-        account_columns = {col["name"] for col in inspector.get_columns("accounts")}
+    def _migrate_schema() -> None:
+        """Eski veritabanlarında eksik kolonları ve indeksleri ekler."""
+
+        # Üç tablonun kolonları tek sorguda okunur.
+        tablo_kolonlari: Dict[str, Set[str]] = defaultdict(set)
+        for tablo, kolon in db.session.execute(
+            text(
+                "SELECT m.name, p.name FROM sqlite_master AS m, pragma_table_info(m.name) AS p "
+                "WHERE m.type = 'table' AND m.name IN ('accounts', 'transactions', 'categories')"
+            )
+        ):
+            tablo_kolonlari[tablo].add(kolon)
+
+        account_columns = tablo_kolonlari["accounts"]
         if "currency" not in account_columns:
             db.session.execute(
                 text(
@@ -105,59 +279,100 @@ def create_app() -> Flask:
             )
             db.session.commit()
 
-        transaction_columns = {col["name"] for col in inspector.get_columns("transactions")}
+        transaction_columns = tablo_kolonlari["transactions"]
         if "emotion" not in transaction_columns:
             db.session.execute(
                 text("ALTER TABLE transactions ADD COLUMN emotion VARCHAR(50)")
             )
             db.session.commit()
 
-        category_columns = {col["name"] for col in inspector.get_columns("categories")}
+        category_columns = tablo_kolonlari["categories"]
         if "monthly_limit" not in category_columns:
             db.session.execute(
                 text("ALTER TABLE categories ADD COLUMN monthly_limit FLOAT")
             )
             db.session.commit()
 
-        # Uygulama ilk kez açıldığında varsayılan kayıtlar oluşturalım.
+        # Yerini daha geniş indekslere bırakan eski indeksler kaldırılır.
+        db.session.execute(text("DROP INDEX IF EXISTS ix_txn_cat_type"))
+        db.session.execute(text("DROP INDEX IF EXISTS ix_txn_account"))
+
+        # create_all mevcut tablolara yeni indeks eklemediği için modeldeki indeksler burada kurulur.
+        for index in Transaction.__table__.indexes:
+            db.session.execute(CreateIndex(index, if_not_exists=True))
+
+        # Aylık toplamlar olay dinleyicileriyle güncel tutulur; ilk kurulumda mevcut işlemlerden doldurulur.
+        MonthlyCategoryTotal.rebuild()
+        db.session.commit()
+
+    def _prepare_schema() -> None:
+        """Tabloları oluşturur ve şemayı güncel sürüme taşır."""
+
+        db.create_all()
+        _migrate_schema()
+        db.session.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION}"))
+        db.session.commit()
+
+    def _seed_defaults() -> None:
+        """Hesap veya kategori yoksa varsayılan kayıtları ekler."""
+
         if not Account.query.first():
-            db.session.add_all(
+            db.session.execute(
+                insert(Account),
                 [
-                    Account(name="Nakit", description="Cüzdandaki para", currency=DEFAULT_CURRENCY),
-                    Account(name="Banka", description="Vadesiz hesap", currency=DEFAULT_CURRENCY),
-                    Account(
-                        name="Kredi Kartı",
-                        description="Kart harcamaları",
-                        currency=DEFAULT_CURRENCY,
-                    ),
-                ]
+                    {"name": "Nakit", "description": "Cüzdandaki para", "currency": DEFAULT_CURRENCY},
+                    {"name": "Banka", "description": "Vadesiz hesap", "currency": DEFAULT_CURRENCY},
+                    {
+                        "name": "Kredi Kartı",
+                        "description": "Kart harcamaları",
+                        "currency": DEFAULT_CURRENCY,
+                    },
+                ],
             )
             db.session.commit()
         if not Category.query.first():
-            db.session.add_all(
+            db.session.execute(
+                insert(Category),
                 [
-                    Category(name="Maaş", color="success"),
-                    Category(name="Market", color="warning"),
-                    Category(name="Faturalar", color="danger"),
-                    Category(name="Diğer", color="secondary"),
-                ]
+                    {"name": "Maaş", "color": "success"},
+                    {"name": "Market", "color": "warning"},
+                    {"name": "Faturalar", "color": "danger"},
+                    {"name": "Diğer", "color": "secondary"},
+                ],
             )
             db.session.commit()
 
-        app.config["_schema_initialized"] = True
+    def initialize_database(force: bool = False) -> None:
+        """Uygulamanın ihtiyaç duyduğu tabloları ve kolonları güvenli şekilde oluşturur."""
+
+        with _SCHEMA_LOCK:
+            # Şema sürümü süreçte değil veritabanı dosyasının user_version alanında tutulur; dosya
+            # silinir ya da değiştirilirse sürüm de değişir ve kurulum yeniden yapılır. Güncel
+            # veritabanlarında create_all ve kolon yansıtma (reflection) adımları atlanır.
+            schema_version = db.session.execute(text("PRAGMA user_version")).scalar() or 0
+            if force or schema_version < SCHEMA_VERSION:
+                _prepare_schema()
+            _seed_defaults()
 
     with app.app_context():
         initialize_database()
 
+    @app.cli.command("rebuild-monthly-totals")
+    def rebuild_monthly_totals() -> None:
+        """Aylık kategori toplamlarını işlem tablosundan yeniden üretir."""
+
+        MonthlyCategoryTotal.rebuild()
+        db.session.commit()
+        click.echo("Aylık kategori toplamları yeniden oluşturuldu.")
+
     @app.template_filter("turkish_date")
     def turkish_date(value: date | datetime) -> str:
         """Tarihleri gg.aa.yyyy formatında gösteren şablon filtresi."""
 
         if value is None:
             return ""
-        if isinstance(value, datetime):
-            value = value.date()
-        return value.strftime("%d.%m.%Y")
+        # date ve datetime aynı biçim belirtecini desteklediği için tür kontrolüne gerek yok.
+        return _format_turkish_date(value)
 
     @app.template_filter("format_amount")
     def format_amount(value: float | Decimal | None, decimal_places: int = 8) -> str:
@@ -166,12 +381,23 @@ def create_app() -> Flask:
         if value is None:
             return "0"
 
+        # Sık gelen int/float değerlerde Decimal'e hiç girmeden aynı sonuç üretilir;
+        # kesme (ROUND_DOWN) gerekiyorsa yavaş yola düşülür.
+        value_type = type(value)
+        if value_type is int:
+            return str(value)
+        if value_type is float:
+            metin = repr(value)
+            nokta = metin.find(".")
+            if nokta != -1 and "e" not in metin and len(metin) - nokta - 1 <= decimal_places:
+                return metin.rstrip("0").rstrip(".") or "0"
+
         try:
             decimal_value = value if isinstance(value, Decimal) else Decimal(str(value))
         except (InvalidOperation, TypeError, ValueError):
             return str(value)
 
-        quantize_exp = Decimal(f"1e-{decimal_places}")
+        quantize_exp = _QUANTIZERS.get(decimal_places) or Decimal(f"1e-{decimal_places}")
         try:
             quantized = decimal_value.quantize(quantize_exp, rounding=ROUND_DOWN)
         except InvalidOperation:
@@ -186,31 +412,33 @@ def create_app() -> Flask:
     def inject_common_data() -> Dict[str, object]:
         """Şablonlarda sık kullanılan verileri otomatik olarak sağlar."""
 
+        ortak_veri = g.get("_ortak_veri")
+        if ortak_veri is not None:
+            return ortak_veri
+
         user = getattr(g, "user", None)
-        accounts: List[Account] = []
-        categories: List[Category] = []
+        accounts: List[object] = []
+        categories: List[object] = []
         toplam_bakiye = 0.0
         toplam_gelir = 0.0
         toplam_gider = 0.0
 
         if user is not None:
-            accounts = Account.query.all()
-            categories = Category.query.all()
-            toplam_bakiye = sum(a.balance() for a in accounts)
-            toplam_gelir = sum(
-                t.amount for t in Transaction.query.filter_by(type="gelir").all()
-            )
-            toplam_gider = sum(
-                t.amount for t in Transaction.query.filter_by(type="gider").all()
-            )
+            accounts = _hesap_listesi()
+            categories = _kategori_listesi()
 
-        return {
+            toplamlar = _islem_toplamlari()
+            toplam_bakiye = sum(toplamlar["bakiyeler"].get(a.id, 0.0) for a in accounts)
+            toplam_gelir = toplamlar["gelir"]
+            toplam_gider = toplamlar["gider"]
+
+        g._ortak_veri = {
             "tum_hesaplar": accounts,
             "tum_kategoriler": categories,
             "toplam_bakiye": toplam_bakiye,
             "toplam_gelir": toplam_gelir,
             "toplam_gider": toplam_gider,
-            "now": datetime.now,
+            "now": lambda: g.now,
             "currency_symbols": CURRENCY_SYMBOLS,
             "default_currency": DEFAULT_CURRENCY,
             "default_currency_symbol": CURRENCY_SYMBOLS[DEFAULT_CURRENCY],
@@ -218,6 +446,14 @@ def create_app() -> Flask:
             "emotion_labels": EMOTION_LABELS,
             "current_user": user,
         }
+        return g._ortak_veri
+
+    @app.before_request
+    def set_request_clock() -> None:
+        """İstek boyunca tutarlı bir "şimdi" için saati tek sefer okur."""
+
+        g.now = datetime.now()
+        g.today = g.now.date()
 
     @app.before_request
     def load_logged_in_user() -> None:
@@ -238,6 +474,36 @@ def create_app() -> Flask:
 
         return wrapped_view
 
+    rapor_onbellegi: Dict[tuple, tuple[float, object]] = {}
+    rapor_nesli = _write_generation
+
+    def onbellekli(fonksiyon):
+        """Rapor yardımcılarının sonucunu günlük anahtar ve TTL ile bellekte tutar.
+
+        Rapor verisine dokunan her commit yazma neslini artırır; nesil değişince önbellek boşaltılır.
+        Aynı sonuç nesnesi sonraki isteklere de döndüğü için çağıranlar onu salt okunur kullanmalıdır.
+        """
+
+        @wraps(fonksiyon)
+        def wrapped(*args):
+            nonlocal rapor_nesli
+            nesil = _write_generation
+            if rapor_nesli != nesil:
+                rapor_onbellegi.clear()
+                rapor_nesli = nesil
+            anahtar = (fonksiyon.__name__, g.today, *args)
+            simdi = time.monotonic()
+            kayit = rapor_onbellegi.get(anahtar)
+            if kayit is not None and simdi - kayit[0] < REPORT_CACHE_TTL:
+                return kayit[1]
+            sonuc = fonksiyon(*args)
+            # Hesaplama sürerken bir commit olduysa sonuç eski veriye dayanabilir; saklanmaz.
+            if nesil == _write_generation:
+                rapor_onbellegi[anahtar] = (simdi, sonuc)
+            return sonuc
+
+        return wrapped
+
     @app.route("/register", methods=["GET", "POST"])
     def register():
         """Yeni kullanıcı kaydı oluşturur."""
@@ -300,63 +566,29 @@ def create_app() -> Flask:
     def dashboard():
         """Ana gösterge paneli."""
 
-        bugun = date.today()
-        ay_baslangic = bugun.replace(day=1)
-        son_otuz_gun = date.today() - timedelta(days=29)
-        son_otuz_gun_islemleri = (
-            Transaction.query.filter(Transaction.date >= son_otuz_gun)
-            .order_by(Transaction.date.asc())
-            .all()
-        )
+        ay_baslangic = g.today.replace(day=1)
 
-        gunluk_toplamlar: Dict[date, float] = defaultdict(float)
-        for t in son_otuz_gun_islemleri:
-            gunluk_toplamlar[t.date] += t.signed_amount()
-        trend_verisi = []
-        tarih = son_otuz_gun
-        while tarih <= date.today():
-            trend_verisi.append(
-                {
-                    "tarih": tarih.strftime("%d.%m.%Y"),
-                    "tutar": gunluk_toplamlar.get(tarih, 0.0),
-                }
-            )
-            tarih += timedelta(days=1)
-
-        gelirler = (
-            db.session.query(db.func.sum(Transaction.amount))
-            .filter(Transaction.type == "gelir")
-            .scalar()
-            or 0
-        )
-        giderler = (
-            db.session.query(db.func.sum(Transaction.amount))
-            .filter(Transaction.type == "gider")
-            .scalar()
-            or 0
-        )
+        toplamlar = _islem_toplamlari()
+        gelirler = toplamlar["gelir"]
+        giderler = toplamlar["gider"]
         net_bakiye = gelirler - giderler
 
-        kategori_toplamlari = (
-            db.session.query(
-                Category.name,
-                Category.color,
-                db.func.sum(Transaction.amount).label("toplam"),
-            )
-            .join(Transaction, Transaction.category_id == Category.id)
-            .filter(Transaction.type == "gider")
-            .group_by(Category.id)
-            .order_by(db.desc("toplam"))
-            .all()
+        kategori_limit_durumlari = _kategori_limit_durumlari()
+        kategori_toplamlari = sorted(
+            (
+                {
+                    "name": durum["kategori"].name,
+                    "color": durum["kategori"].color,
+                    "toplam": durum["toplam_gider"],
+                }
+                for durum in kategori_limit_durumlari
+                if durum["toplam_gider"] is not None
+            ),
+            key=lambda kategori: kategori["toplam"],
+            reverse=True,
         )
         en_cok_harcanan = kategori_toplamlari[0] if kategori_toplamlari else None
 
-        hesap_bakiyeleri = [
-            {"hesap": hesap.name, "bakiye": hesap.balance()} for hesap in Account.query.all()
-        ]
-
-        aylik_veriler = _aylik_gelir_gider_dagilimi()
-
         duygu_ozeti_sorgu = (
             db.session.query(
                 Transaction.emotion,
@@ -384,7 +616,6 @@ def create_app() -> Flask:
 
         tasarruf_planlari, kilit_mesajlari = _tasarruf_planlarini_hazirla()
 
-        kategori_limit_durumlari = _kategori_limit_durumlari()
         limitli_kategoriler = [
             durum for durum in kategori_limit_durumlari if durum["limit"] is not None
         ]
@@ -397,9 +628,6 @@ def create_app() -> Flask:
             net_bakiye=net_bakiye,
             kategori_toplamlari=kategori_toplamlari,
             en_cok_harcanan=en_cok_harcanan,
-            trend_verisi=trend_verisi,
-            hesap_bakiyeleri=hesap_bakiyeleri,
-            aylik_veriler=aylik_veriler,
             duygu_ozeti=duygu_ozeti,
             tasarruf_planlari=tasarruf_planlari,
             kilit_mesajlari=kilit_mesajlari,
@@ -408,6 +636,17 @@ def create_app() -> Flask:
             limit_uyarilari=limit_uyarilari,
         )
 
+    @app.route("/api/dashboard.json")
+    @login_required
+    def dashboard_data():
+        """Gösterge panelindeki grafiklerin verisini ETag ile JSON olarak döndürür."""
+
+        yanit = jsonify(_dashboard_grafik_verisi())
+        yanit.add_etag()
+        yanit.cache_control.private = True
+        yanit.cache_control.no_cache = True
+        return yanit.make_conditional(request)
+
     @app.route("/savings-goals", methods=["POST"])
     @login_required
     def create_savings_goal():
@@ -415,7 +654,7 @@ def create_app() -> Flask:
 
         ad = request.form.get("name", "").strip()
         hedef_tutar = request.form.get("target_amount", type=float)
-        baslangic_tarihi = _parse_date(request.form.get("start_date")) or date.today()
+        baslangic_tarihi = _parse_date(request.form.get("start_date")) or g.today
         hedef_tarihi = _parse_date(request.form.get("target_date"))
 
         if not ad or not hedef_tutar or hedef_tutar <= 0 or hedef_tarihi is None:
@@ -451,8 +690,24 @@ def create_app() -> Flask:
     def _parse_date(value: str | None) -> date | None:
         """Formlardan gelen tarih değerlerini Türkçe format desteğiyle çözümler."""
 
+        value = value.strip() if value else value
         if not value:
             return None
+
+        # Tarayıcıdan gelen sıfır dolgulu biçimler strptime'a uğramadan çözülür.
+        if len(value) == 10:
+            try:
+                if value[4] == "-" and value[7] == "-":
+                    yil, ay, gun = value[:4], value[5:7], value[8:]
+                elif value[2] == "." and value[5] == ".":
+                    gun, ay, yil = value[:2], value[3:5], value[6:]
+                else:
+                    yil = ay = gun = ""
+                if yil.isdigit() and ay.isdigit() and gun.isdigit():
+                    return date(int(yil), int(ay), int(gun))
+            except ValueError:
+                return None
+
         for fmt in ("%Y-%m-%d", "%d.%m.%Y"):
             try:
                 return datetime.strptime(value, fmt).date()
@@ -484,6 +739,7 @@ def create_app() -> Flask:
         return render_template(
             "accounts.html",
             hesaplar=hesaplar,
+            bakiyeler=_islem_toplamlari()["bakiyeler"],
             para_birimleri=CURRENCY_CHOICES,
         )
 
@@ -535,8 +791,13 @@ def create_app() -> Flask:
             return redirect(url_for("categories"))
 
         kategori_durumlari = _kategori_limit_durumlari()
+        kategori_toplamlari = {satir["name"]: satir for satir in _kategori_dagilimi()}
 
-        return render_template("categories.html", kategori_durumlari=kategori_durumlari)
+        return render_template(
+            "categories.html",
+            kategori_durumlari=kategori_durumlari,
+            kategori_toplamlari=kategori_toplamlari,
+        )
 
     @app.route("/categories/<int:category_id>/update", methods=["POST"])
     @login_required
@@ -573,7 +834,7 @@ def create_app() -> Flask:
 
         if request.method == "POST":
             tarih_str = request.form.get("date")
-            tarih = _parse_date(tarih_str) or date.today()
+            tarih = _parse_date(tarih_str) or g.today
             kategori_id = request.form.get("category_id", type=int)
             hesap_id = request.form.get("account_id", type=int)
             tur = request.form.get("type", "gider")
@@ -603,24 +864,97 @@ def create_app() -> Flask:
         kategori_id = request.args.get("category_id", type=int)
         tur = request.args.get("type", default="tumu")
 
-        sorgu = Transaction.query.order_by(Transaction.date.desc(), Transaction.id.desc())
+        onceki_tarih = _parse_date(request.args.get("before_date"))
+        onceki_id = request.args.get("before_id", type=int)
+        sonraki_tarih = _parse_date(request.args.get("after_date"))
+        sonraki_id = request.args.get("after_id", type=int)
+
+        kosullar = []
         if baslangic:
-            sorgu = sorgu.filter(Transaction.date >= baslangic)
+            kosullar.append(Transaction.date >= baslangic)
         if bitis:
-            sorgu = sorgu.filter(Transaction.date <= bitis)
+            kosullar.append(Transaction.date <= bitis)
         if kategori_id:
-            sorgu = sorgu.filter(Transaction.category_id == kategori_id)
+            kosullar.append(Transaction.category_id == kategori_id)
         if tur in {"gelir", "gider"}:
-            sorgu = sorgu.filter(Transaction.type == tur)
-
-        islemler = sorgu.all()
+            kosullar.append(Transaction.type == tur)
 
-        toplam = sum(t.signed_amount() for t in islemler)
+        # Sayfalar (tarih, id) anahtarıyla ilerler; bir fazla kayıt bir sonraki sayfanın varlığını
+        # gösterir. before_* ileri, after_* geri gider.
+        # Liste yalnızca okunur; ORM nesneleri yerine ihtiyaç duyulan kolonlar birleştirilerek alınır.
+        temel_sorgu = (
+            db.session.query(
+                Transaction.id,
+                Transaction.date,
+                Transaction.type,
+                Transaction.description,
+                Transaction.amount,
+                Transaction.emotion,
+                Transaction.category_id,
+                Transaction.account_id,
+                Category.name.label("category_name"),
+                Category.color.label("category_color"),
+                Account.name.label("account_name"),
+                Account.currency.label("account_currency"),
+            )
+            .join(Category, Transaction.category_id == Category.id)
+            .join(Account, Transaction.account_id == Account.id)
+            .filter(*kosullar)
+        )
+        sayfa_anahtari = db.tuple_(Transaction.date, Transaction.id)
+        islemler = []
+        ilk_sayfa_mi = True
+        sonraki_sayfa_var = False
+        if sonraki_tarih and sonraki_id:
+            # Geri giderken anahtardan sonraki kayıtlar artan sırada alınıp ters çevrilir; önceki
+            # kayıtlar bir sayfayı doldurmuyorsa ilk sayfa gösterilir.
+            islemler = (
+                temel_sorgu.filter(sayfa_anahtari > (sonraki_tarih, sonraki_id))
+                .order_by(Transaction.date.asc(), Transaction.id.asc())
+                .limit(TRANSACTIONS_PAGE_SIZE + 1)
+                .all()
+            )
+            if len(islemler) > TRANSACTIONS_PAGE_SIZE:
+                islemler = islemler[:TRANSACTIONS_PAGE_SIZE][::-1]
+                ilk_sayfa_mi = False
+                sonraki_sayfa_var = True
+            else:
+                islemler = []
+
+        if not islemler:
+            sorgu = temel_sorgu
+            if onceki_tarih and onceki_id:
+                sorgu = sorgu.filter(sayfa_anahtari < (onceki_tarih, onceki_id))
+                ilk_sayfa_mi = False
+            islemler = (
+                sorgu.order_by(Transaction.date.desc(), Transaction.id.desc())
+                .limit(TRANSACTIONS_PAGE_SIZE + 1)
+                .all()
+            )
+            sonraki_sayfa_var = len(islemler) > TRANSACTIONS_PAGE_SIZE
+            islemler = islemler[:TRANSACTIONS_PAGE_SIZE]
+
+        # Net toplam tüm filtre sonucunu kapsar ve veritabanında hesaplanır. Tutarlar en fazla
+        # 8 ondalık basamakla girildiği için toplam, kayan nokta artıklarından arındırılır.
+        toplam = round(
+            db.session.query(db.func.sum(Transaction.signed_amount))
+            .filter(*kosullar)
+            .scalar()
+            or 0,
+            8,
+        )
 
         return render_template(
             "transactions.html",
             islemler=islemler,
             toplam=toplam,
+            ilk_sayfa_mi=ilk_sayfa_mi,
+            sonraki_sayfa_var=sonraki_sayfa_var,
+            sayfa_parametreleri={
+                anahtar: deger
+                for anahtar, deger in request.args.items()
+                if anahtar not in {"before_date", "before_id", "after_date", "after_id"} and deger
+            },
             filtreler={
                 "start_date": baslangic.strftime("%Y-%m-%d") if baslangic else "",
                 "end_date": bitis.strftime("%Y-%m-%d") if bitis else "",
@@ -668,8 +1002,9 @@ def create_app() -> Flask:
 
         aylik_veriler = _aylik_gelir_gider_dagilimi()
         kategori_dagilimi = _kategori_dagilimi()
+        bakiyeler = _islem_toplamlari()["bakiyeler"]
         hesap_dagilimi = [
-            {"label": hesap.name, "value": round(hesap.balance(), 2)}
+            {"label": hesap.name, "value": round(bakiyeler.get(hesap.id, 0.0), 2)}
             for hesap in Account.query.order_by(Account.name)
         ]
 
@@ -680,31 +1015,93 @@ def create_app() -> Flask:
             hesap_dagilimi=hesap_dagilimi,
         )
 
+    @onbellekli
+    def _hesap_listesi() -> List[object]:
+        """Şablonlardaki hesap seçimleri için hafif satırları döndürür."""
+
+        return (
+            db.session.query(Account.id, Account.name, Account.currency)
+            .order_by(Account.id)
+            .all()
+        )
+
+    @onbellekli
+    def _kategori_listesi() -> List[object]:
+        """Şablonlardaki kategori seçimleri için hafif satırları döndürür."""
+
+        return db.session.query(Category.id, Category.name).order_by(Category.id).all()
+
+    def _islem_toplamlari() -> Dict[str, object]:
+        """Hesap bakiyelerini ve gelir/gider toplamlarını istek başına bir kez hesaplar."""
+
+        toplamlar = g.get("_islem_toplamlari")
+        if toplamlar is not None:
+            return toplamlar
+
+        tur_toplamlari = dict(db.session.execute(_STMT_TOTALS_BY_TYPE).all())
+        toplamlar = {
+            "bakiyeler": Account.balances_for_all(),
+            "gelir": tur_toplamlari.get("gelir") or 0.0,
+            "gider": tur_toplamlari.get("gider") or 0.0,
+        }
+        g._islem_toplamlari = toplamlar
+        return toplamlar
+
+    @onbellekli
+    def _dashboard_grafik_verisi() -> Dict[str, object]:
+        """Gösterge panelindeki trend, hesap ve aylık grafiklerin verisini hazırlar."""
+
+        son_otuz_gun = g.today - timedelta(days=29)
+        gunluk_toplamlar: Dict[date, float] = dict(
+            db.session.execute(_STMT_DAILY_NET, {"baslangic": son_otuz_gun}).all()
+        )
+        trend_verisi = [
+            {
+                "tarih": _format_turkish_date(tarih),
+                "tutar": gunluk_toplamlar.get(tarih, 0.0),
+            }
+            for tarih in (son_otuz_gun + timedelta(days=i) for i in range(30))
+        ]
+
+        bakiyeler = _islem_toplamlari()["bakiyeler"]
+        hesap_bakiyeleri = [
+            {"hesap": hesap.name, "bakiye": bakiyeler.get(hesap.id, 0.0)}
+            for hesap in Account.query.all()
+        ]
+
+        return {
+            "trend_verisi": trend_verisi,
+            "hesap_bakiyeleri": hesap_bakiyeleri,
+            "aylik_veriler": _aylik_gelir_gider_dagilimi(),
+        }
+
     def _kategori_limit_durumlari() -> List[Dict[str, object]]:
         """Kategorilerin aylık limitlerine göre durum özetini hazırlar."""
 
-        ay_baslangic = date.today().replace(day=1)
-        sonraki_ay = ay_baslangic + relativedelta(months=1)
-
-        aylik_harcamalar = {
-            kategori_id: toplam or 0.0
-            for kategori_id, toplam in (
-                db.session.query(
-                    Transaction.category_id,
-                    db.func.sum(Transaction.amount).label("toplam"),
-                )
-                .filter(Transaction.type == "gider")
-                .filter(Transaction.date >= ay_baslangic)
-                .filter(Transaction.date < sonraki_ay)
-                .group_by(Transaction.category_id)
-                .all()
+        # Tüm zamanların ve bu ayın giderleri aylık toplam tablosundan alınır; kategoriler
+        # bu özete LEFT JOIN ile bağlanarak liste ve toplamlar tek sorguda gelir.
+        bu_ay = MonthlyCategoryTotal.year_month == g.today.strftime("%Y-%m")
+        gider_ozeti = (
+            db.session.query(
+                MonthlyCategoryTotal.category_id,
+                db.func.sum(MonthlyCategoryTotal.total).label("toplam"),
+                db.func.sum(db.case((bu_ay, MonthlyCategoryTotal.total), else_=0.0)).label("aylik"),
             )
-        }
+            .filter(MonthlyCategoryTotal.type == "gider")
+            .group_by(MonthlyCategoryTotal.category_id)
+            .subquery()
+        )
+        satirlar = (
+            db.session.query(Category, gider_ozeti.c.toplam, gider_ozeti.c.aylik)
+            .outerjoin(gider_ozeti, Category.id == gider_ozeti.c.category_id)
+            .order_by(Category.name.asc())
+            .all()
+        )
 
         durumlar: List[Dict[str, object]] = []
-        for kategori in Category.query.order_by(Category.name.asc()).all():
+        for kategori, toplam_gider, aylik_harcama in satirlar:
             limit = kategori.monthly_limit
-            aylik_harcama = float(aylik_harcamalar.get(kategori.id, 0.0))
+            aylik_harcama = float(aylik_harcama or 0.0)
 
             limit_asildi = False
             kalan_limit = None
@@ -726,167 +1123,145 @@ def create_app() -> Flask:
                     "kalan_limit": kalan_limit,
                     "limit_asildi": limit_asildi,
                     "kullanilan_oran": kullanilan_oran,
+                    "toplam_gider": toplam_gider,
                 }
             )
 
         return durumlar
 
+    @onbellekli
     def _aylik_gelir_gider_dagilimi() -> Dict[str, List]:
         """Son 6 ayın gelir/gider dağılımını çıkarır."""
 
-        bugun = date.today().replace(day=1)
+        bugun = g.today.replace(day=1)
+        ilk_ay = bugun - relativedelta(months=5)
         aylar: List[str] = []
         gelir_listesi: List[float] = []
         gider_listesi: List[float] = []
 
+        aylik_toplamlar = {
+            (ay, tur): toplam or 0
+            for ay, tur, toplam in db.session.execute(
+                _STMT_MONTHLY_TYPE_TOTALS,
+                {"baslangic": ilk_ay.strftime("%Y-%m"), "bitis": bugun.strftime("%Y-%m")},
+            )
+        }
+
         for i in range(5, -1, -1):
             ay_baslangic = bugun - relativedelta(months=i)
-            sonraki_ay = ay_baslangic + relativedelta(months=1)
-            ay_etiketi = ay_baslangic.strftime("%m.%Y")
-            aylar.append(ay_etiketi)
-
-            ay_gelir = (
-                db.session.query(db.func.sum(Transaction.amount))
-                .filter(Transaction.type == "gelir")
-                .filter(Transaction.date >= ay_baslangic)
-                .filter(Transaction.date < sonraki_ay)
-                .scalar()
-                or 0
-            )
-            ay_gider = (
-                db.session.query(db.func.sum(Transaction.amount))
-                .filter(Transaction.type == "gider")
-                .filter(Transaction.date >= ay_baslangic)
-                .filter(Transaction.date < sonraki_ay)
-                .scalar()
-                or 0
-            )
-            gelir_listesi.append(round(ay_gelir, 2))
-            gider_listesi.append(round(ay_gider, 2))
+            aylar.append(ay_baslangic.strftime("%m.%Y"))
+            anahtar = ay_baslangic.strftime("%Y-%m")
+            gelir_listesi.append(round(aylik_toplamlar.get((anahtar, "gelir"), 0), 2))
+            gider_listesi.append(round(aylik_toplamlar.get((anahtar, "gider"), 0), 2))
 
         return {"labels": aylar, "gelir": gelir_listesi, "gider": gider_listesi}
 
-    def _ay_sayisi(baslangic: date, bitis: date) -> int:
-        """İki tarih arasındaki ay sayısını (en az 1) hesaplar."""
-
-        if bitis < baslangic:
-            return 0
-        delta = relativedelta(bitis, baslangic)
-        ay_farki = delta.years * 12 + delta.months
-        if delta.days >= 0:
-            ay_farki += 1
-        return max(ay_farki, 1)
-
-    def _tasarruf_planlarini_hazirla() -> tuple[List[Dict[str, object]], List[Dict[str, object]]]:
+    @onbellekli
+    def _tasarruf_planlarini_hazirla() -> tuple[List[PlanRow], List[Dict[str, object]]]:
         """Tasarruf hedeflerini detaylandırır ve kilit mesajlarını döndürür."""
 
-        bugun = date.today()
-        planlar: List[Dict[str, object]] = []
-        kilit_mesajlari: List[Dict[str, object]] = []
+        bugun = g.today
+        planlar: List[PlanRow] = []
+        hedef_kilitleri: List[List[Dict[str, object]]] = []
 
         tum_hedefler = SavingsGoal.query.order_by(SavingsGoal.target_date.asc()).all()
+
+        # Tüm hedeflerin penceresini kapsayan günlük toplamlar tek sorguda alınır; her hedefin
+        # günleri ikili aramayla bulunur. Dilimler fsum ile toplanır; kümülatif farklar önceki
+        # büyük tutarların yuvarlama hatasını hedefin toplamına taşırdı.
+        gunler: List[date] = []
+        gunluk_gelirler: List[float] = []
+        gunluk_giderler: List[float] = []
+        if tum_hedefler:
+            en_erken = min(hedef.start_date for hedef in tum_hedefler)
+            for gun, gelir, gider in db.session.execute(
+                _STMT_DAILY_TYPE_TOTALS, {"baslangic": en_erken, "bitis": bugun}
+            ):
+                gunler.append(gun)
+                gunluk_gelirler.append(gelir or 0.0)
+                gunluk_giderler.append(gider or 0.0)
+
+        bugun_sira = bugun.toordinal()
         for hedef in tum_hedefler:
+            # ORM öznitelikleri döngü başında bir kez okunur.
             baslangic = hedef.start_date
             hedef_tarihi = hedef.target_date
-            if isinstance(baslangic, datetime):
-                baslangic = baslangic.date()
-            if isinstance(hedef_tarihi, datetime):
-                hedef_tarihi = hedef_tarihi.date()
+            hedef_tutari = hedef.target_amount
+            hedef_adi = hedef.name
 
             plan_suresi = max(_ay_sayisi(baslangic, hedef_tarihi), 1)
             takip_bitis = min(hedef_tarihi, bugun)
-            gelir_toplam = (
-                db.session.query(db.func.sum(Transaction.amount))
-                .filter(Transaction.type == "gelir")
-                .filter(Transaction.date >= baslangic)
-                .filter(Transaction.date <= takip_bitis)
-                .scalar()
-                or 0
-            )
-            gider_toplam = (
-                db.session.query(db.func.sum(Transaction.amount))
-                .filter(Transaction.type == "gider")
-                .filter(Transaction.date >= baslangic)
-                .filter(Transaction.date <= takip_bitis)
-                .scalar()
-                or 0
-            )
+            ilk = bisect_left(gunler, baslangic)
+            son = bisect_right(gunler, takip_bitis)
+            gelir_toplam = math.fsum(gunluk_gelirler[ilk:son])
+            gider_toplam = math.fsum(gunluk_giderler[ilk:son])
             net_birikim = gelir_toplam - gider_toplam
-            kalan_tutar = max(0.0, hedef.target_amount - net_birikim)
+            kalan_tutar = max(0.0, hedef_tutari - net_birikim)
 
-            hedefe_kalan_gun = (hedef_tarihi - bugun).days
+            hedefe_kalan_gun = hedef_tarihi.toordinal() - bugun_sira
             hedefe_kalan_gun = hedefe_kalan_gun if hedefe_kalan_gun >= 0 else 0
 
             ilerleme = 0.0
-            if hedef.target_amount > 0:
-                ilerleme = max(0.0, min(100.0, (net_birikim / hedef.target_amount) * 100))
+            if hedef_tutari > 0:
+                oran = (net_birikim / hedef_tutari) * 100
+                ilerleme = 0.0 if oran < 0.0 else 100.0 if oran > 100.0 else oran
 
             gecen_ay_sayisi = 0
             if bugun >= baslangic:
                 gecen_ay_sayisi = _ay_sayisi(baslangic, takip_bitis)
 
             ortalama_aylik = net_birikim / gecen_ay_sayisi if gecen_ay_sayisi else 0.0
-            onerilen_aylik = hedef.target_amount / plan_suresi if plan_suresi else hedef.target_amount
+            onerilen_aylik = hedef_tutari / plan_suresi if plan_suresi else hedef_tutari
 
             kilitler: List[Dict[str, object]] = []
-            for milestone in GOAL_MILESTONES:
-                if ilerleme >= milestone["threshold"]:
-                    kilit = {
-                        **milestone,
-                        "goal_name": hedef.name,
-                    }
-                    kilitler.append(kilit)
-                    kilit_mesajlari.append(kilit)
+            # Eşikler artan sırada olduğundan açılan kilitler listenin bir ön ekidir.
+            for milestone in GOAL_MILESTONES[: bisect_right(_MILESTONE_THRESHOLDS, ilerleme)]:
+                kilit = milestone.copy()
+                kilit["goal_name"] = hedef_adi
+                kilitler.append(kilit)
+            hedef_kilitleri.append(kilitler)
 
             planlar.append(
-                {
-                    "id": hedef.id,
-                    "name": hedef.name,
-                    "target_amount": hedef.target_amount,
-                    "start_date": baslangic,
-                    "target_date": hedef_tarihi,
-                    "net_savings": net_birikim,
-                    "remaining_amount": kalan_tutar,
-                    "remaining_days": hedefe_kalan_gun,
-                    "progress": ilerleme,
-                    "recommended_monthly": onerilen_aylik,
-                    "actual_monthly": ortalama_aylik,
-                    "is_completed": ilerleme >= 100,
-                    "unlocked_milestones": kilitler,
-                    "total_months": plan_suresi,
-                    "elapsed_months": gecen_ay_sayisi,
-                }
+                PlanRow(
+                    id=hedef.id,
+                    name=hedef_adi,
+                    target_amount=hedef_tutari,
+                    start_date=baslangic,
+                    target_date=hedef_tarihi,
+                    net_savings=net_birikim,
+                    remaining_amount=kalan_tutar,
+                    remaining_days=hedefe_kalan_gun,
+                    progress=ilerleme,
+                    recommended_monthly=onerilen_aylik,
+                    actual_monthly=ortalama_aylik,
+                    is_completed=ilerleme >= 100,
+                    unlocked_milestones=kilitler,
+                    total_months=plan_suresi,
+                    elapsed_months=gecen_ay_sayisi,
+                )
             )
 
-        kilit_mesajlari.sort(key=lambda item: (item["threshold"], item["goal_name"]))
+        # Her hedefin kilitleri eşiğe göre zaten sıralı; tam sıralama yerine birleştirilir.
+        kilit_mesajlari = list(
+            heapq.merge(*hedef_kilitleri, key=itemgetter("threshold", "goal_name"))
+        )
         return planlar, kilit_mesajlari
 
+    @onbellekli
     def _kategori_dagilimi() -> List[Dict[str, object]]:
         """Gelir ve giderlerin kategori bazında dağılımını hesaplar."""
 
-        sorgu = (
-            db.session.query(
-                Category.name,
-                Category.color,
-                db.func.sum(Transaction.amount).label("toplam"),
-                Transaction.type,
+        return [
+            {
+                "name": isim,
+                "color": renk,
+                "gelir": round(gelir_toplam or 0, 2),
+                "gider": round(gider_toplam or 0, 2),
+            }
+            for isim, renk, gelir_toplam, gider_toplam in db.session.execute(
+                _STMT_CATEGORY_TYPE_TOTALS
             )
-            .join(Transaction, Transaction.category_id == Category.id)
-            .group_by(Category.id, Transaction.type)
-            .order_by(Category.name)
-        )
-
-        dagilim: Dict[str, Dict[str, object]] = {}
-        for isim, renk, toplam, tur in sorgu:
-            if isim not in dagilim:
-                dagilim[isim] = {
-                    "name": isim,
-                    "color": renk,
-                    "gelir": 0.0,
-                    "gider": 0.0,
-                }
-            dagilim[isim][tur] = round(toplam or 0, 2)
-        return list(dagilim.values())
+        ]
 
     return app
 
@@ -1,7 +1,10 @@
 """SQLAlchemy modelleri ve yardımcı fonksiyonlar."""
 from datetime import date, datetime
+from typing import Dict
 
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.hybrid import hybrid_property
 
 
 db = SQLAlchemy()
@@ -18,6 +21,12 @@ class User(db.Model):
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
 
+def _net_tutar_toplami():
+    """İşlemlerin işaretli tutarlarını toplayan ve boş kümede 0 dönen SUM ifadesi."""
+
+    return db.func.coalesce(db.func.sum(Transaction.signed_amount), 0.0)
+
+
 class Account(db.Model):
     """Gelir ve gider işlemlerinin bağlandığı finansal hesap modeli."""
 
@@ -30,12 +39,34 @@ class Account(db.Model):
 
     transactions = db.relationship("Transaction", back_populates="account", cascade="all, delete-orphan")
 
-    def balance(self) -> float:
-        """Hesaba ait net bakiyeyi gelir - gider olarak hesaplar."""
+    @classmethod
+    def balances_for_all(cls) -> Dict[int, float]:
+        """Tüm hesapların bakiyelerini tek GROUP BY sorgusuyla ``{hesap_id: bakiye}`` olarak döner."""
+
+        return dict(
+            db.session.execute(
+                db.select(Transaction.account_id, _net_tutar_toplami()).group_by(
+                    Transaction.account_id
+                )
+            ).all()
+        )
 
-        gelirler = sum(t.amount for t in self.transactions if t.type == "gelir")
-        giderler = sum(t.amount for t in self.transactions if t.type == "gider")
-        return gelirler - giderler
+    @hybrid_property
+    def current_balance(self) -> float:
+        """Net bakiyeyi örnekte tek SUM sorgusuyla, sorgularda ilişkili alt sorgu olarak verir."""
+
+        return db.session.execute(
+            db.select(_net_tutar_toplami()).where(Transaction.account_id == self.id)
+        ).scalar()
+
+    @current_balance.inplace.expression
+    @classmethod
+    def _current_balance_expression(cls):
+        return (
+            db.select(_net_tutar_toplami())
+            .where(Transaction.account_id == cls.id)
+            .scalar_subquery()
+        )
 
 
 class Category(db.Model):
@@ -55,24 +86,137 @@ class Transaction(db.Model):
     """Gelir ve gider işlem tablosu."""
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        db.Index("ix_txn_date_type", "date", "type"),
+        db.Index("ix_txn_cat_type_date", "category_id", "type", "date"),
+        db.Index("ix_txn_account_type_amount", "account_id", "type", "amount"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    date = db.Column(db.Date, nullable=False, default=datetime.utcnow)
-    category_id = db.Column(db.Integer, db.ForeignKey("categories.id"), nullable=False)
+    # Aylık toplam dinleyicileri eski kovayı bulabilsin diye tarih, kategori ve türün
+    # önceki değeri, nesne expire edilmiş olsa bile güncellemeden önce yüklenir.
+    date = db.column_property(
+        db.Column(db.Date, nullable=False, default=datetime.utcnow), active_history=True
+    )
+    category_id = db.column_property(
+        db.Column(db.Integer, db.ForeignKey("categories.id"), nullable=False),
+        active_history=True,
+    )
     description = db.Column(db.String(255))
     amount = db.Column(db.Float, nullable=False)
     account_id = db.Column(db.Integer, db.ForeignKey("accounts.id"), nullable=False)
-    type = db.Column(db.String(10), nullable=False)  # gelir ya da gider
+    type = db.column_property(
+        db.Column(db.String(10), nullable=False), active_history=True
+    )  # gelir ya da gider
     emotion = db.Column(db.String(50))
 
     account = db.relationship("Account", back_populates="transactions")
     category = db.relationship("Category", back_populates="transactions")
 
+    @hybrid_property
     def signed_amount(self) -> float:
         """Gelir ve gideri toplu hesaplamalar için işaretli miktara çevirir."""
 
         return self.amount if self.type == "gelir" else -self.amount
 
+    @signed_amount.inplace.expression
+    @classmethod
+    def _signed_amount_expression(cls):
+        return db.case((cls.type == "gelir", cls.amount), else_=-cls.amount)
+
+
+class MonthlyCategoryTotal(db.Model):
+    """İşlem tablosundan türetilen kategori/ay/tür bazlı toplamlar.
+
+    Satırlar Transaction eşleyici olaylarıyla güncel tutulur; bu yüzden işlemler yalnızca ORM
+    oturumu üzerinden (``add``, ``delete``, öznitelik ataması) yazılmalıdır. Toplu Core
+    ifadeleri ya da uygulama dışından yapılan değişiklikler olayları tetiklemez; bu durumda
+    tablo ``rebuild()`` ile (ör. ``flask rebuild-monthly-totals``) yeniden üretilir.
+    """
+
+    __tablename__ = "monthly_category_totals"
+
+    category_id = db.Column(db.Integer, primary_key=True)
+    year_month = db.Column(db.String(7), primary_key=True)  # YYYY-AA
+    type = db.Column(db.String(10), primary_key=True)
+    total = db.Column(db.Float, nullable=False, default=0.0)
+
+    @classmethod
+    def rebuild(cls) -> None:
+        """Tabloyu işlem tablosundan baştan üretir; commit çağırana bırakılır."""
+
+        yil_ay = db.func.strftime("%Y-%m", Transaction.date)
+        db.session.execute(db.delete(cls))
+        db.session.execute(
+            db.insert(cls).from_select(
+                ["category_id", "year_month", "type", "total"],
+                db.select(
+                    Transaction.category_id, yil_ay, Transaction.type, db.func.sum(Transaction.amount)
+                ).group_by(Transaction.category_id, yil_ay, Transaction.type),
+            )
+        )
+
+
+def _aylik_toplami_yenile(connection, kategori_id: int, tarih: date, tur: str) -> None:
+    """Bir kategori/ay/tür satırını işlem tablosundan yeniden hesaplar; işlem kalmadıysa siler."""
+
+    ay_basi = date(tarih.year, tarih.month, 1)
+    sonraki_ay = date(ay_basi.year + ay_basi.month // 12, ay_basi.month % 12 + 1, 1)
+    yil_ay = ay_basi.strftime("%Y-%m")
+    tablo = MonthlyCategoryTotal.__table__
+
+    connection.execute(
+        tablo.delete().where(
+            tablo.c.category_id == kategori_id,
+            tablo.c.year_month == yil_ay,
+            tablo.c.type == tur,
+        )
+    )
+    # Artımlı fark yerine SUM kullanılır; kayan nokta kalıntısı birikmez ve boş kova satır üretmez.
+    connection.execute(
+        tablo.insert().from_select(
+            ["category_id", "year_month", "type", "total"],
+            db.select(
+                Transaction.category_id,
+                db.literal(yil_ay),
+                Transaction.type,
+                db.func.sum(Transaction.amount),
+            )
+            .where(
+                Transaction.category_id == kategori_id,
+                Transaction.type == tur,
+                Transaction.date >= ay_basi,
+                Transaction.date < sonraki_ay,
+            )
+            .group_by(Transaction.category_id, Transaction.type),
+        )
+    )
+
+
+@event.listens_for(Transaction, "after_insert")
+@event.listens_for(Transaction, "after_delete")
+def _islem_eklendi_veya_silindi(mapper, connection, islem: Transaction) -> None:
+    """Eklenen ya da silinen işlemin aylık toplamını yeniler."""
+
+    _aylik_toplami_yenile(connection, islem.category_id, islem.date, islem.type)
+
+
+@event.listens_for(Transaction, "after_update")
+def _islem_guncellendi(mapper, connection, islem: Transaction) -> None:
+    """Güncellenen işlemin eski ve yeni aylık toplamlarını yeniler."""
+
+    durum = inspect(islem)
+
+    def onceki(alan: str):
+        gecmis = durum.attrs[alan].history
+        return gecmis.deleted[0] if gecmis.deleted else getattr(islem, alan)
+
+    eski = (onceki("category_id"), onceki("date"), onceki("type"))
+    yeni = (islem.category_id, islem.date, islem.type)
+    _aylik_toplami_yenile(connection, *eski)
+    if yeni != eski:
+        _aylik_toplami_yenile(connection, *yeni)
+
 
 class SavingsGoal(db.Model):
     """Tasarruf hedeflerini temsil eden model."""
@@ -87,4 +231,12 @@ class SavingsGoal(db.Model):
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
 
-__all__ = ["db", "User", "Account", "Category", "Transaction", "SavingsGoal"]
+__all__ = [
+    "db",
+    "User",
+    "Account",
+    "Category",
+    "Transaction",
+    "MonthlyCategoryTotal",
+    "SavingsGoal",
+]
@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path):
+    """Geçici bir SQLite veritabanıyla uygulama oluşturur."""
+
+    uygulama = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'test.db'}",
+        }
+    )
+    yield uygulama
+
+
+@pytest.fixture
+def client(app):
+    """Kayıtlı ve giriş yapmış bir kullanıcının test istemcisi."""
+
+    istemci = app.test_client()
+    bilgiler = {"email": "test@example.com", "password": "gizli"}
+    istemci.post("/register", data={**bilgiler, "confirm_password": "gizli"})
+    istemci.post("/login", data=bilgiler)
+    return istemci
@@ -0,0 +1,116 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import func
+
+from models import Account, Category, MonthlyCategoryTotal, Transaction, db
+
+
+@pytest.fixture
+def ctx(app):
+    with app.app_context():
+        yield
+
+
+@pytest.fixture
+def kategoriler(ctx):
+    return Category.query.order_by(Category.id).all()
+
+
+@pytest.fixture
+def hesap(ctx):
+    return Account.query.first()
+
+
+def _toplamlar():
+    """Tablodaki satırlar ile işlem tablosundan baştan hesaplanan toplamları döndürür."""
+
+    tablo = {
+        (satir.category_id, satir.year_month, satir.type): satir.total
+        for satir in MonthlyCategoryTotal.query.all()
+    }
+    yil_ay = func.strftime("%Y-%m", Transaction.date)
+    beklenen = {
+        (kategori_id, ay, tur): toplam
+        for kategori_id, ay, tur, toplam in db.session.query(
+            Transaction.category_id, yil_ay, Transaction.type, func.sum(Transaction.amount)
+        ).group_by(Transaction.category_id, yil_ay, Transaction.type)
+    }
+    return tablo, beklenen
+
+
+def _islem(kategori, hesap, tarih, tutar, tur="gider"):
+    islem = Transaction(
+        date=tarih, category_id=kategori.id, account_id=hesap.id, amount=tutar, type=tur
+    )
+    db.session.add(islem)
+    db.session.commit()
+    return islem
+
+
+def test_ekleme_kovayi_gunceller(kategoriler, hesap):
+    _islem(kategoriler[0], hesap, date(2024, 3, 5), 10.1)
+    _islem(kategoriler[0], hesap, date(2024, 3, 20), 20.2)
+    _islem(kategoriler[0], hesap, date(2024, 3, 20), 5.0, "gelir")
+
+    tablo, beklenen = _toplamlar()
+    assert tablo == beklenen
+    assert tablo[(kategoriler[0].id, "2024-03", "gider")] == pytest.approx(30.3)
+
+
+@pytest.mark.parametrize(
+    "alan, deger",
+    [
+        ("category_id", 1),
+        ("date", date(2024, 4, 1)),
+        ("type", "gelir"),
+        ("amount", 99.0),
+    ],
+)
+def test_guncelleme_eski_ve_yeni_kovayi_yeniler(kategoriler, hesap, alan, deger):
+    islem = _islem(kategoriler[0], hesap, date(2024, 3, 31), 12.5)
+    _islem(kategoriler[0], hesap, date(2024, 3, 1), 7.5)
+    if alan == "category_id":
+        deger = kategoriler[1].id
+
+    # Commit sonrası öznitelikler süresi dolmuş (expired) durumdadır; eski değer yine bulunmalı.
+    setattr(islem, alan, deger)
+    db.session.commit()
+
+    tablo, beklenen = _toplamlar()
+    assert tablo == beklenen
+
+
+def test_son_islem_silinince_kova_satiri_kalmaz(kategoriler, hesap):
+    islem = _islem(kategoriler[0], hesap, date(2024, 3, 5), 10.0)
+    db.session.delete(islem)
+    db.session.commit()
+
+    assert MonthlyCategoryTotal.query.count() == 0
+
+
+@pytest.mark.parametrize("model", [Category, Account])
+def test_basamakli_silme_kovalari_temizler(kategoriler, hesap, model):
+    _islem(kategoriler[0], hesap, date(2024, 3, 5), 10.0)
+    _islem(kategoriler[1], hesap, date(2024, 3, 6), 4.0)
+    diger_hesap = Account.query.filter(Account.id != hesap.id).first()
+    _islem(kategoriler[0], diger_hesap, date(2024, 3, 7), 1.0)
+
+    silinecek = kategoriler[0] if model is Category else hesap
+    db.session.delete(silinecek)
+    db.session.commit()
+
+    tablo, beklenen = _toplamlar()
+    assert tablo == beklenen
+
+
+def test_rebuild_core_yazimlarindan_sonra_tabloyu_onarir(kategoriler, hesap):
+    _islem(kategoriler[0], hesap, date(2024, 3, 5), 10.0)
+    db.session.execute(db.update(Transaction).values(amount=25.0))
+    db.session.commit()
+
+    MonthlyCategoryTotal.rebuild()
+    db.session.commit()
+
+    tablo, beklenen = _toplamlar()
+    assert tablo == beklenen == {(kategoriler[0].id, "2024-03", "gider"): 25.0}
@@ -0,0 +1,80 @@
+from datetime import date
+
+import pytest
+from flask import template_rendered
+from sqlalchemy import insert, update
+
+from models import Account, Category, Transaction, db
+
+
+def _kategori_giderleri(app, client):
+    """Kategoriler sayfasındaki (önbellekli) kategori gider toplamlarını döndürür."""
+
+    yakalanan = {}
+
+    def kaydet(gonderen, template, context, **extra):
+        if template.name == "categories.html":
+            yakalanan.update(
+                {isim: satir["gider"] for isim, satir in context["kategori_toplamlari"].items()}
+            )
+
+    with template_rendered.connected_to(kaydet, app):
+        assert client.get("/categories").status_code == 200
+    return yakalanan
+
+
+@pytest.fixture
+def kategori(app, client):
+    with app.app_context():
+        kategori = Category.query.first()
+        hesap = Account.query.first()
+        db.session.add(
+            Transaction(
+                date=date.today(),
+                category_id=kategori.id,
+                account_id=hesap.id,
+                amount=10.0,
+                type="gider",
+            )
+        )
+        db.session.commit()
+        return kategori.name, kategori.id, hesap.id
+
+
+def test_orm_yazmasi_onbellegi_eskitir(app, client, kategori):
+    isim, _, _ = kategori
+    assert _kategori_giderleri(app, client)[isim] == 10.0
+
+    with app.app_context():
+        islem = Transaction.query.first()
+        islem.amount = 15.0
+        db.session.commit()
+
+    assert _kategori_giderleri(app, client)[isim] == 15.0
+
+
+def test_toplu_yazmalar_onbellegi_eskitir(app, client, kategori):
+    isim, kategori_id, hesap_id = kategori
+    assert _kategori_giderleri(app, client)[isim] == 10.0
+
+    with app.app_context():
+        db.session.execute(
+            insert(Transaction),
+            [
+                {
+                    "date": date.today(),
+                    "category_id": kategori_id,
+                    "account_id": hesap_id,
+                    "amount": 5.0,
+                    "type": "gider",
+                }
+            ],
+        )
+        db.session.commit()
+    assert _kategori_giderleri(app, client)[isim] == 15.0
+
+    with app.app_context():
+        db.session.execute(update(Transaction).values(amount=1.0))
+        db.session.commit()
+    assert _kategori_giderleri(app, client)[isim] == 2.0
+
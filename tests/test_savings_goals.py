@@ -0,0 +1,85 @@
+from datetime import date, timedelta
+
+import pytest
+from flask import template_rendered
+
+from models import Account, Category, SavingsGoal, Transaction, db
+
+
+@pytest.fixture
+def planlar(app, client):
+    """Panelde hesaplanan tasarruf planlarını hedef adına göre döndürür."""
+
+    bugun = date.today()
+    with app.app_context():
+        kategori = Category.query.first()
+        hesap = Account.query.first()
+
+        def islem(gun_farki, tutar, tur="gelir"):
+            return Transaction(
+                date=bugun + timedelta(days=gun_farki),
+                category_id=kategori.id,
+                account_id=hesap.id,
+                amount=tutar,
+                type=tur,
+            )
+
+        db.session.add_all(
+            [
+                SavingsGoal(
+                    name="Uzun",
+                    target_amount=50000,
+                    start_date=bugun - timedelta(days=30),
+                    target_date=bugun + timedelta(days=5),
+                ),
+                SavingsGoal(
+                    name="Sinirlar",
+                    target_amount=1000,
+                    start_date=bugun - timedelta(days=15),
+                    target_date=bugun - timedelta(days=3),
+                ),
+                SavingsGoal(
+                    name="Tam",
+                    target_amount=500,
+                    start_date=bugun - timedelta(days=1),
+                    target_date=bugun + timedelta(days=5),
+                ),
+                # Büyük bir eski tutar, sonraki pencerelerin toplamına yuvarlama hatası taşımamalı.
+                islem(-20, 16021.94),
+                islem(-16, 10),
+                islem(-15, 100),
+                islem(-10, 20, "gider"),
+                islem(-3, 50),
+                islem(-2, 7),
+                islem(-1, 186.47),
+                islem(0, 313.53),
+            ]
+        )
+        db.session.commit()
+
+    yakalanan = {}
+
+    def kaydet(gonderen, template, context, **extra):
+        if template.name == "dashboard.html":
+            yakalanan.update({plan.name: plan for plan in context["tasarruf_planlari"]})
+
+    with template_rendered.connected_to(kaydet, app):
+        assert client.get("/").status_code == 200
+    return yakalanan
+
+
+def test_hedef_penceresi_baslangic_ve_hedef_gunlerini_kapsar(planlar):
+    # Başlangıç (-15) ve hedef (-3) günleri dahil, bir gün öncesi ve sonrası hariç.
+    assert planlar["Sinirlar"].net_savings == 130.0
+    assert planlar["Sinirlar"].remaining_amount == 870.0
+
+
+def test_devam_eden_hedef_bugunu_kapsar(planlar):
+    beklenen = 16021.94 + 10 + 100 - 20 + 50 + 7 + 186.47 + 313.53
+    assert planlar["Uzun"].net_savings == pytest.approx(beklenen)
+
+
+def test_tam_tutar_hedefi_tamamlar(planlar):
+    assert planlar["Tam"].net_savings == 500.0
+    assert planlar["Tam"].remaining_amount == 0.0
+    assert planlar["Tam"].is_completed
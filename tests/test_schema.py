@@ -0,0 +1,28 @@
+from sqlalchemy import text
+
+from app import SCHEMA_VERSION, create_app
+from models import Account, Category, db
+
+
+def _uygulama(yol):
+    return create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": f"sqlite:///{yol}"})
+
+
+def test_silinen_veritabani_yeniden_kurulur(tmp_path):
+    yol = tmp_path / "butce.db"
+    _uygulama(yol)
+    yol.unlink()
+
+    uygulama = _uygulama(yol)
+    with uygulama.app_context():
+        assert db.session.execute(text("PRAGMA user_version")).scalar() == SCHEMA_VERSION
+        assert Account.query.count() == 3
+        assert Category.query.count() == 4
+
+
+def test_guncel_veritabani_tekrar_tohumlanmaz(tmp_path):
+    yol = tmp_path / "butce.db"
+    _uygulama(yol)
+    uygulama = _uygulama(yol)
+    with uygulama.app_context():
+        assert Account.query.count() == 3
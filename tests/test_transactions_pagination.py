@@ -0,0 +1,101 @@
+import re
+from datetime import date, timedelta
+
+import pytest
+
+from app import TRANSACTIONS_PAGE_SIZE
+from models import Account, Category, Transaction, db
+
+SONRAKI = re.compile(r'href="([^"]*before_id=[^"]*)"')
+ONCEKI = re.compile(r'href="([^"]*after_id=[^"]*)"')
+SATIR = re.compile(r"<td>islem-(\d+)-</td>")
+
+
+@pytest.fixture
+def islem_idleri(app, client):
+    """Aynı tarihe düşen çok sayıda kayıtla sayfalamayı zorlayan işlemler ekler."""
+
+    with app.app_context():
+        kategori = Category.query.first()
+        hesap = Account.query.first()
+        bugun = date.today()
+        kayitlar = []
+        # Üç sayfayı aşan ve çoğu aynı günde biriken kayıtlar.
+        for sira in range(TRANSACTIONS_PAGE_SIZE * 3 + 7):
+            tarih = bugun if sira % 4 else bugun - timedelta(days=sira // 4)
+            kayitlar.append(
+                Transaction(
+                    date=tarih,
+                    category_id=kategori.id,
+                    account_id=hesap.id,
+                    description=f"islem-{sira}-",
+                    amount=1.0,
+                    type="gider",
+                )
+            )
+        db.session.add_all(kayitlar)
+        db.session.commit()
+        beklenen = (
+            Transaction.query.order_by(Transaction.date.desc(), Transaction.id.desc()).all()
+        )
+        return [islem.description for islem in beklenen]
+
+
+def _sayfa(client, url):
+    yanit = client.get(url)
+    assert yanit.status_code == 200
+    html = yanit.get_data(as_text=True)
+    satirlar = [f"islem-{sira}-" for sira in SATIR.findall(html)]
+    sonraki = SONRAKI.search(html)
+    onceki = ONCEKI.search(html)
+    return (
+        satirlar,
+        sonraki.group(1).replace("&amp;", "&") if sonraki else None,
+        onceki.group(1).replace("&amp;", "&") if onceki else None,
+    )
+
+
+def test_sayfalar_ayni_tarihli_kayitlari_atlamadan_ve_tekrarlamadan_gezer(client, islem_idleri):
+    gorulen = []
+    sayfalar = []
+    url = "/transactions"
+    while url:
+        satirlar, url, _ = _sayfa(client, url)
+        assert len(satirlar) <= TRANSACTIONS_PAGE_SIZE
+        sayfalar.append(satirlar)
+        gorulen.extend(satirlar)
+
+    assert gorulen == islem_idleri
+    assert len(sayfalar) == 4
+
+
+def test_onceki_sayfa_bir_onceki_kayitlari_gosterir(client, islem_idleri):
+    birinci, ikinci_url, onceki = _sayfa(client, "/transactions")
+    assert onceki is None
+    ikinci, ucuncu_url, _ = _sayfa(client, ikinci_url)
+    _, _, ikinciye_don = _sayfa(client, ucuncu_url)
+
+    geri, _, _ = _sayfa(client, ikinciye_don)
+    assert geri == ikinci
+
+    _, _, birinciye_don = _sayfa(client, ikinci_url)
+    geri, _, onceki = _sayfa(client, birinciye_don)
+    assert geri == birinci
+    assert onceki is None
+
+
+@pytest.mark.parametrize(
+    "sorgu",
+    [
+        "before_date=2024-99-99&before_id=5",
+        "before_date=abc&before_id=5",
+        "before_date=2024-01-01&before_id=abc",
+        "before_id=5",
+        "after_date=abc&after_id=1",
+        "after_date=2999-01-01&after_id=1",
+    ],
+)
+def test_gecersiz_imlec_ilk_sayfayi_dondurur(client, islem_idleri, sorgu):
+    satirlar, _, onceki = _sayfa(client, f"/transactions?{sorgu}")
+    assert satirlar == islem_idleri[:TRANSACTIONS_PAGE_SIZE]
+    assert onceki is None